@@ -1,14 +1,34 @@
 import sys
 import os
 import re
+import json
+import queue
+import weakref
+from collections import deque
+from functools import lru_cache
 import cv2
 import numpy as np
 import speech_recognition as sr
 import pyttsx3
-from typing import Optional, List
-from fuzzywuzzy import fuzz
-from PySide6.QtCore import Qt, QThread, Signal, Slot, QTimer, QEventLoop
-from PySide6.QtGui import QPixmap, QImage, QFont, QColor, QKeySequence, QAction, QPalette, QWheelEvent
+import zstandard as zstd
+from typing import Optional, List, Tuple, Deque, Union
+from rapidfuzz import fuzz, process
+
+# Optional offline speech recognition (falls back to Google when missing)
+try:
+    import vosk
+except ImportError:
+    vosk = None
+
+# Optional Pillow (ideally pillow-simd) for large display downscales
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+from PySide6.QtCore import Qt, QThread, Signal, QTimer, QEvent, QRect
+from PySide6.QtGui import (
+    QPixmap, QImage, QFont, QColor, QKeySequence, QAction, QPalette, QWheelEvent, QPainter, QPen
+)
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QVBoxLayout, QHBoxLayout, QWidget, QStatusBar,
     QPushButton, QFileDialog, QToolBar, QSizePolicy, QDockWidget,
@@ -37,60 +57,412 @@ class Theme:
     
     BORDER = "#444444"
 
+# Global stylesheet - theme values are constant, so build it once at import
+_STYLESHEET = f"""
+    QMainWindow {{
+        background: {Theme.BG_PRIMARY};
+    }}
+    QPushButton {{
+        background-color: {Theme.ACCENT_BLUE};
+        color: {Theme.TEXT_PRIMARY};
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 11px;
+        min-height: 28px;
+    }}
+    QPushButton:hover {{
+        background-color: #1984D8;
+    }}
+    QPushButton:pressed {{
+        background-color: #005A9E;
+    }}
+    QPushButton:checked {{
+        background-color: {Theme.ACCENT_GREEN};
+    }}
+    QGroupBox {{
+        background: {Theme.BG_SECONDARY};
+        border: 1px solid {Theme.BORDER};
+        border-radius: 6px;
+        margin-top: 12px;
+        padding-top: 12px;
+        font-weight: bold;
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }}
+    QSlider::groove:horizontal {{
+        height: 4px;
+        background: {Theme.BG_TERTIARY};
+        border-radius: 2px;
+    }}
+    QSlider::handle:horizontal {{
+        background: {Theme.ACCENT_BLUE};
+        width: 14px;
+        height: 14px;
+        margin: -5px 0;
+        border-radius: 7px;
+    }}
+    QSlider::sub-page:horizontal {{
+        background: {Theme.ACCENT_BLUE};
+        border-radius: 2px;
+    }}
+    QProgressBar {{
+        background: {Theme.BG_TERTIARY};
+        border: 1px solid {Theme.BORDER};
+        border-radius: 4px;
+        text-align: center;
+        color: {Theme.TEXT_PRIMARY};
+    }}
+    QProgressBar::chunk {{
+        background: {Theme.ACCENT_BLUE};
+        border-radius: 4px;
+    }}
+    QListWidget {{
+        background: {Theme.BG_SECONDARY};
+        border: 1px solid {Theme.BORDER};
+        border-radius: 4px;
+        padding: 4px;
+    }}
+    QListWidget::item {{
+        padding: 6px;
+        border-radius: 3px;
+    }}
+    QListWidget::item:hover {{
+        background: {Theme.BG_TERTIARY};
+    }}
+    QListWidget::item:selected {{
+        background: {Theme.ACCENT_BLUE};
+    }}
+    QDockWidget::title {{
+        background: {Theme.BG_TERTIARY};
+        padding: 6px;
+        font-weight: bold;
+    }}
+    QToolBar {{
+        background: {Theme.BG_SECONDARY};
+        border-bottom: 1px solid {Theme.BORDER};
+        spacing: 6px;
+        padding: 6px;
+    }}
+    QStatusBar {{
+        background: {Theme.BG_SECONDARY};
+        border-top: 1px solid {Theme.BORDER};
+    }}
+"""
+
+@lru_cache(maxsize=1)
+def _build_palette() -> QPalette:
+    """Dark color palette matching the theme (built once and shared)"""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(Theme.BG_PRIMARY))
+    palette.setColor(QPalette.WindowText, QColor(Theme.TEXT_PRIMARY))
+    palette.setColor(QPalette.Base, QColor(Theme.BG_SECONDARY))
+    palette.setColor(QPalette.AlternateBase, QColor(Theme.BG_TERTIARY))
+    palette.setColor(QPalette.Text, QColor(Theme.TEXT_PRIMARY))
+    palette.setColor(QPalette.Button, QColor(Theme.BG_TERTIARY))
+    palette.setColor(QPalette.ButtonText, QColor(Theme.TEXT_PRIMARY))
+    palette.setColor(QPalette.Highlight, QColor(Theme.ACCENT_BLUE))
+    palette.setColor(QPalette.HighlightedText, QColor(Theme.TEXT_PRIMARY))
+    return palette
+
 # ========== Utilities ==========
 
+# Sepia transformation matrix (applied to OpenCV's BGR pixels)
+_SEPIA_KERNEL = np.float32([[0.272, 0.534, 0.131],
+                            [0.349, 0.686, 0.168],
+                            [0.393, 0.769, 0.189]])
+
+# Sharpening kernel (enhances edges); float32 is what filter2D works in
+_SHARPEN_KERNEL = np.float32([[-1, -1, -1],
+                              [-1,  9, -1],
+                              [-1, -1, -1]])
+
 def clamp(val: int, lo: int, hi: int) -> int:
     """Clamp value between min and max - prevents slider values from going out of range"""
     return max(lo, min(hi, val))
 
-def numpy_to_qimage(img: np.ndarray) -> QImage:
+@lru_cache(maxsize=512)
+def brightness_contrast_lut(brightness: int, contrast: int) -> np.ndarray:
+    """256-entry lookup table for pixel * contrast/100 + brightness
+    
+    Slider values are integers, so a drag keeps revisiting the same tables;
+    caching them skips rebuilding one on every recompute.
+    """
+    lut = np.clip(np.rint(np.arange(256) * (contrast / 100.0) + brightness), 0, 255).astype(np.uint8)
+    lut.flags.writeable = False  # Shared between calls
+    return lut
+
+@lru_cache(maxsize=512)
+def hue_shift_lut(shift: int) -> np.ndarray:
+    """256-entry lookup table rotating OpenCV hue (0-179) by shift, wrapping around"""
+    lut = ((np.arange(256) + shift) % 180).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+@lru_cache(maxsize=256)
+def saturation_lut(saturation: int) -> np.ndarray:
+    """256-entry lookup table scaling saturation by saturation/100"""
+    lut = np.clip(np.arange(256) * (saturation / 100.0), 0, 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+def numpy_to_qimage(img: np.ndarray) -> Tuple[QImage, Optional[np.ndarray]]:
     """Convert OpenCV's NumPy array to Qt's QImage format
     
-    OpenCV uses BGR format and NumPy arrays, while Qt uses RGB and QImage.
-    This function handles the conversion and different image types (grayscale, RGB, RGBA).
+    OpenCV stores pixels as BGR(A). Qt can read that memory layout directly
+    (Format_BGR888 / Format_ARGB32), so no channel swap is needed.
+    This function handles the different image types (grayscale, BGR, BGRA).
+    
+    The QImage wraps the array's memory without copying it, so it is returned
+    together with that array: the caller must keep the array alive for as
+    long as the QImage is in use. QPixmap.fromImage copies the pixels, so a
+    local reference until then is enough.
     """
     if img is None or img.size == 0:
-        return QImage()
+        return QImage(), None
     
     # Ensure image data is in uint8 format (0-255)
     if img.dtype != np.uint8:
         img = np.clip(img, 0, 255).astype(np.uint8, copy=False)
     
+    # QImage needs rows laid out back to back so stride == width * channels
+    img = np.ascontiguousarray(img)
+    
     # Handle grayscale images
     if img.ndim == 2:
         h, w = img.shape
-        return QImage(img.data, w, h, w, QImage.Format_Grayscale8).copy()
+        return QImage(img.data, w, h, w, QImage.Format_Grayscale8), img
     
     # Handle color images
     if img.ndim == 3:
         h, w, ch = img.shape
         if ch == 3:
-            # Convert BGR (OpenCV) to RGB (Qt)
-            rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            return QImage(rgb.data, w, h, 3 * w, QImage.Format_RGB888).copy()
+            # Qt reads OpenCV's BGR byte order as-is
+            return QImage(img.data, w, h, 3 * w, QImage.Format_BGR888), img
         if ch == 4:
-            # Handle images with alpha channel
+            # BGRA bytes are ARGB32 (0xAARRGGBB) on little-endian machines
+            if sys.byteorder == "little":
+                return QImage(img.data, w, h, 4 * w, QImage.Format_ARGB32), img
             rgba = cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
-            return QImage(rgba.data, w, h, 4 * w, QImage.Format_RGBA8888).copy()
+            return QImage(rgba.data, w, h, 4 * w, QImage.Format_RGBA8888), rgba
     
     # Fallback: convert to grayscale if format is unknown
     gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img
     h, w = gray.shape
-    return QImage(gray.data, w, h, w, QImage.Format_Grayscale8).copy()
+    return QImage(gray.data, w, h, w, QImage.Format_Grayscale8), gray
 
-def compress_image(img: np.ndarray) -> bytes:
-    """Compress image to JPEG bytes for undo stack
+def fast_resize(img: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Downscale an image for display
+    
+    Shrinking by more than 4x goes through Pillow's box filter when it's
+    installed (pillow-simd vectorizes it and beats INTER_AREA there);
+    smaller reductions use OpenCV. The filter treats channels independently,
+    so BGR data goes in and comes out unchanged in order.
+    """
+    if (PILImage is not None and img.dtype == np.uint8 and img.shape[1] / width > 4
+            and (img.ndim == 2 or img.shape[2] == 3)):
+        return np.asarray(PILImage.fromarray(img).resize((width, height), PILImage.BOX))
+    return cv2.resize(img, (width, height), interpolation=cv2.INTER_AREA)
+
+# JPEG start-of-frame markers (every SOFn except DHT/JPG/DAC, which share the range)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Decoder-side downscaling flags: {grayscale?: {factor: flag}}
+_REDUCED_FLAGS = {
+    False: {2: cv2.IMREAD_REDUCED_COLOR_2, 4: cv2.IMREAD_REDUCED_COLOR_4, 8: cv2.IMREAD_REDUCED_COLOR_8},
+    True: {2: cv2.IMREAD_REDUCED_GRAYSCALE_2, 4: cv2.IMREAD_REDUCED_GRAYSCALE_4, 8: cv2.IMREAD_REDUCED_GRAYSCALE_8},
+}
+
+def jpeg_size(data) -> Optional[Tuple[int, int, int]]:
+    """Read (width, height, components) from a JPEG header without decoding
+    
+    Walks the marker segments up to the start-of-frame. Returns None for
+    anything that isn't a readable JPEG.
+    """
+    view = memoryview(data)
+    if len(view) < 4 or view[0] != 0xFF or view[1] != 0xD8:
+        return None
+    i = 2
+    while i + 9 < len(view):
+        if view[i] != 0xFF:
+            return None
+        marker = view[i + 1]
+        if marker == 0xFF:  # Fill byte before a marker
+            i += 1
+        elif marker in _JPEG_SOF_MARKERS:
+            height = (view[i + 5] << 8) | view[i + 6]
+            width = (view[i + 7] << 8) | view[i + 8]
+            return width, height, view[i + 9]
+        elif marker == 0x01 or 0xD0 <= marker <= 0xD7:  # Markers without a length
+            i += 2
+        else:
+            i += 2 + ((view[i + 2] << 8) | view[i + 3])
+    return None
+
+# Image file extensions accepted by drag & drop
+_IMG_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.webp', '.tiff', '.gif'})
+
+def read_image(path: str, max_size: int = 2048) -> Optional[np.ndarray]:
+    """Load an image file, downscaled so its longest side is at most max_size
+    
+    Large JPEGs are decoded straight at 1/2, 1/4 or 1/8 scale (the decoder
+    skips most of the DCT work), then resized the rest of the way.
+    Returns None if the file can't be decoded.
+    """
+    buf = np.fromfile(path, dtype=np.uint8)
+    if buf.size == 0:
+        return None  # cv2.imdecode raises on an empty buffer
+    
+    flags = cv2.IMREAD_UNCHANGED
+    size = jpeg_size(buf)
+    if size:
+        w, h, components = size
+        for factor in (8, 4, 2):
+            if max(w, h) / factor >= max_size:
+                # Ignore EXIF orientation like IMREAD_UNCHANGED does
+                flags = _REDUCED_FLAGS[components == 1][factor] | cv2.IMREAD_IGNORE_ORIENTATION
+                break
+    
+    img = cv2.imdecode(buf, flags)
+    if img is None:
+        return None
+    
+    # Resize if image is too large (prevents memory issues)
+    h, w = img.shape[:2]
+    if max(h, w) > max_size:
+        scale = max_size / max(h, w)
+        new_w, new_h = int(w * scale), int(h * scale)
+        img = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_AREA)
+    return img
+
+# Undo snapshot: (shape, dtype string, zstd-compressed raw pixels)
+Snapshot = Tuple[tuple, str, bytes]
+
+# Shared zstd contexts - creating them per call costs more than compressing
+_ZSTD_COMPRESSOR = zstd.ZstdCompressor(level=1, threads=-1)
+_ZSTD_DECOMPRESSOR = zstd.ZstdDecompressor()
+
+def compress_image(img: np.ndarray) -> Snapshot:
+    """Compress raw image pixels with zstd for undo stack
     
     Storing full images in undo stack uses too much memory.
-    JPEG compression reduces memory usage while maintaining acceptable quality.
+    Fast lossless compression keeps memory down while undo/redo stays
+    bit-exact (no quality loss piling up across undo cycles).
     """
-    encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), 90]
-    _, buffer = cv2.imencode('.jpg', img, encode_param)
-    return buffer.tobytes()
+    data = _ZSTD_COMPRESSOR.compress(np.ascontiguousarray(img))  # Reads the pixel buffer directly
+    return img.shape, img.dtype.str, data
+
+def decompress_image(snapshot: Snapshot) -> np.ndarray:
+    """Decompress zstd snapshot back to image array"""
+    shape, dtype, data = snapshot
+    return np.frombuffer(_ZSTD_DECOMPRESSOR.decompress(data), dtype=dtype).reshape(shape)
+
+# Edits that can be undone exactly: op name -> (forward, inverse). Their undo
+# entries hold just the name, and undo/redo replay the matching transform
+# instead of storing a full-frame snapshot. Both return new arrays.
+_INVERTIBLE_OPS = {
+    "rotate_left": (lambda img: cv2.rotate(img, cv2.ROTATE_90_COUNTERCLOCKWISE),
+                    lambda img: cv2.rotate(img, cv2.ROTATE_90_CLOCKWISE)),
+    "rotate_right": (lambda img: cv2.rotate(img, cv2.ROTATE_90_CLOCKWISE),
+                     lambda img: cv2.rotate(img, cv2.ROTATE_90_COUNTERCLOCKWISE)),
+    "flip_horizontal": (lambda img: cv2.flip(img, 1), lambda img: cv2.flip(img, 1)),
+    "flip_vertical": (lambda img: cv2.flip(img, 0), lambda img: cv2.flip(img, 0)),
+    "invert": (cv2.bitwise_not, cv2.bitwise_not),
+}
+
+# Undo/redo stack entry: an _INVERTIBLE_OPS name or a pixel snapshot
+UndoEntry = Union[str, Snapshot]
+
+def gaussian_blur_cuda(img: np.ndarray, ksize: Tuple[int, int]) -> np.ndarray:
+    """Gaussian blur on the GPU (same result as cv2.GaussianBlur with sigma 0)
+    
+    CUDA filters only take 1- or 4-channel 8-bit images, so BGR is widened
+    to BGRA on the device and narrowed again before download.
+    """
+    gpu = cv2.cuda_GpuMat()
+    gpu.upload(img)
+    channels = 1 if img.ndim == 2 else img.shape[2]
+    if channels == 3:
+        gpu = cv2.cuda.cvtColor(gpu, cv2.COLOR_BGR2BGRA)
+    mat_type = cv2.CV_8UC1 if channels == 1 else cv2.CV_8UC4
+    blurred = cv2.cuda.createGaussianFilter(mat_type, mat_type, ksize, 0).apply(gpu)
+    if channels == 3:
+        blurred = cv2.cuda.cvtColor(blurred, cv2.COLOR_BGRA2BGR)
+    return blurred.download()
+
+# ========== Voice Command Patterns ==========
+# Compiled once at import and shared by every window.
+
+# Command key (see handle_command) -> accepted phrases. All phrases are joined
+# into one alternation, so an utterance is matched in a single pass and only
+# falls back to fuzzy matching when nothing matches exactly.
+_COMMAND_PHRASES = [
+    ("grayscale", r"gr[ae]y\s*scale"),
+    ("blur", r"blur"),
+    ("sharpen", r"sharpen"),
+    ("edge", r"edges?(?:\s*detect(?:ion)?)?"),
+    ("sepia", r"sepia"),
+    ("invert", r"invert"),
+    ("histogram", r"histogram(?:\s*equali[sz]ation)?"),
+    ("adaptive", r"adaptive(?:\s*threshold(?:ing)?)?"),
+    ("saturation", r"saturation"),
+    ("rotate left", r"rotate\s*left"),
+    ("rotate right", r"rotate\s*right"),
+    ("flip horizontal", r"flip\s*horizontal(?:ly)?"),
+    ("flip vertical", r"flip\s*vertical(?:ly)?"),
+    ("zoom in", r"zoom\s*in"),
+    ("zoom out", r"zoom\s*out"),
+    ("reset zoom", r"reset\s*zoom"),
+    ("fit", r"fit(?:\s*to)?(?:\s*window)?"),
+    ("undo", r"undo"),
+    ("redo", r"redo"),
+    ("reset", r"reset(?:\s*image)?"),
+    ("help", r"help"),
+    ("exit", r"exit"),
+]
+_COMMAND_IDS = [key for key, _ in _COMMAND_PHRASES]
+_RE_COMMAND = re.compile(
+    "|".join(f"(?P<c{i}>{pattern})" for i, (_, pattern) in enumerate(_COMMAND_PHRASES)),
+    re.IGNORECASE,
+)
 
-def decompress_image(buffer: bytes) -> np.ndarray:
-    """Decompress JPEG bytes back to image array"""
-    return cv2.imdecode(np.frombuffer(buffer, np.uint8), cv2.IMREAD_UNCHANGED)
+# Parameterized commands - one pass extracts the number from commands like:
+# "brightness by 50" -> brightness=50
+# "contrast 120" -> contrast=120
+# The named group that matched says which adjustment slider to set.
+_RE_PARAM = re.compile(
+    r"(?:brightness|brighten)\s*(?:by)?\s*(?P<brightness>-?\d+)"
+    r"|contrast\s*(?:by)?\s*(?P<contrast>-?\d+)"
+    r"|(?:saturation|saturate)\s*(?:by)?\s*(?P<saturation>-?\d+)"
+    r"|hue\s*(?:by)?\s*(?P<hue>-?\d+)"
+)
+
+# ========== Settings ==========
+
+# Small per-user settings file (e.g. remembered microphone calibration)
+SETTINGS_PATH = os.path.join(os.path.expanduser("~"), ".voicephotoeditor.json")
+
+# Offline Vosk model location - download a small English model here to enable it
+VOSK_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "vosk-en-small")
+
+def load_settings() -> dict:
+    """Read saved settings, or an empty dict if missing/unreadable"""
+    try:
+        with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_settings(settings: dict):
+    """Write settings to disk (failures are ignored - settings are a convenience)"""
+    try:
+        with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
+            json.dump(settings, f, indent=2)
+    except OSError:
+        pass
 
 # ========== Speech Threads ==========
 
@@ -98,7 +470,8 @@ class SpeechThread(QThread):
     """Background thread for voice recognition
     
     Runs in separate thread to prevent UI freezing during voice input.
-    Uses Google's speech recognition API.
+    Uses an offline Vosk model when installed (see VOSK_MODEL_PATH),
+    otherwise Google's speech recognition API.
     """
     command_signal = Signal(str)      # Emits recognized text
     error_signal = Signal(str)        # Emits error messages
@@ -114,38 +487,57 @@ class SpeechThread(QThread):
         self.running = False
         self.timeout = timeout
         self.phrase_time_limit = phrase_time_limit
+        self._vosk = None  # Offline recognizer, loaded on first run
+        self._release_microphone = False  # Close the stream when the loop exits (app shutdown)
+        
+        # Reuse the last ambient-noise calibration instead of recalibrating
+        saved_threshold = load_settings().get("energy_threshold")
+        self._calibrated = isinstance(saved_threshold, (int, float))
+        if self._calibrated:
+            self.recognizer.energy_threshold = saved_threshold
 
     def run(self):
         """Main thread loop - continuously listens for voice commands"""
-        # Initialize microphone
+        # Open the microphone on first start; it stays open across toggles
         try:
-            self.microphone = sr.Microphone()
+            self._open_microphone()
             self.status_signal.emit("Ready")
         except Exception as e:
             self.error_signal.emit(f"Microphone error: {str(e)[:50]}")
             return
 
-        # Calibrate for ambient noise (important for accuracy)
-        try:
-            with self.microphone as source:
+        # Calibrate for ambient noise once (important for accuracy), then remember it
+        if not self._calibrated:
+            try:
                 self.status_signal.emit("Calibrating...")
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                self.recognizer.adjust_for_ambient_noise(self.microphone, duration=0.5)
                 self.status_signal.emit("Ready")
-        except Exception as e:
-            self.error_signal.emit(f"Calibration failed: {str(e)[:50]}")
-            return
+            except Exception as e:
+                self.error_signal.emit(f"Calibration failed: {str(e)[:50]}")
+                return
+            self._calibrated = True
+            settings = load_settings()
+            settings["energy_threshold"] = self.recognizer.energy_threshold
+            save_settings(settings)
+        
+        # Load the offline model once (slow, so not on the UI thread)
+        if self._vosk is None and vosk is not None and os.path.isdir(VOSK_MODEL_PATH):
+            try:
+                self.status_signal.emit("Loading model...")
+                self._vosk = vosk.KaldiRecognizer(vosk.Model(VOSK_MODEL_PATH), 16000)
+                self.status_signal.emit("Ready")
+            except Exception as e:
+                self.error_signal.emit(f"Offline model error: {str(e)[:50]}")
 
         # Main listening loop
         while self.running:
             try:
-                with self.microphone as source:
-                    self.status_signal.emit("Listening...")
-                    # Listen for audio input with timeout
-                    audio = self.recognizer.listen(source, timeout=self.timeout, phrase_time_limit=self.phrase_time_limit)
+                self.status_signal.emit("Listening...")
+                # Listen for audio input with timeout
+                audio = self.recognizer.listen(self.microphone, timeout=self.timeout, phrase_time_limit=self.phrase_time_limit)
                 
                 self.status_signal.emit("Processing...")
-                # Send audio to Google for recognition
-                text = self.recognizer.recognize_google(audio, show_all=False).lower()
+                text = self._recognize(audio)
                 self.command_signal.emit(text)
                 
             except sr.WaitTimeoutError:
@@ -162,6 +554,39 @@ class SpeechThread(QThread):
                 # Catch-all for unexpected errors
                 self.error_signal.emit(f"Error: {str(e)[:50]}")
                 self.msleep(1000)
+        
+        # Shutting down: close the stream from this thread, the one reading it
+        if self._release_microphone:
+            self.close_microphone()
+
+    def _recognize(self, audio: sr.AudioData) -> str:
+        """Turn captured audio into lowercase text
+        
+        Decodes locally with Vosk when available (no network round-trip),
+        otherwise sends the audio to Google for recognition.
+        """
+        if self._vosk is not None:
+            self._vosk.AcceptWaveform(audio.get_raw_data(convert_rate=16000, convert_width=2))
+            text = json.loads(self._vosk.FinalResult()).get("text", "")
+            if not text:
+                raise sr.UnknownValueError()
+            return text.lower()
+        return self.recognizer.recognize_google(audio, show_all=False).lower()
+
+    def _open_microphone(self):
+        """Open the microphone stream once (device open takes 100-500 ms)"""
+        if self.microphone is None:
+            microphone = sr.Microphone()
+            microphone.__enter__()  # Opens the audio stream and keeps it open
+            self.microphone = microphone
+
+    def close_microphone(self):
+        """Close the persistent microphone stream (call once listening has stopped)"""
+        if self.microphone is not None:
+            try:
+                self.microphone.__exit__(None, None, None)
+            finally:
+                self.microphone = None
 
     def start_listening(self):
         """Start the voice recognition thread"""
@@ -170,24 +595,30 @@ class SpeechThread(QThread):
             self.start()
 
     def stop_listening(self):
-        """Stop the voice recognition thread"""
+        """Stop the voice recognition thread (the microphone stays open)"""
         self.running = False
         self.wait(1000)
 
+    def shutdown(self):
+        """Stop listening for good; the microphone is closed once the loop exits"""
+        self._release_microphone = True
+        self.running = False
+
 
 class TTSWorker(QThread):
     """Text-to-speech worker thread
     
     Runs TTS in background to avoid blocking UI.
     Uses pyttsx3 which works offline.
+    The thread sleeps on a queue until there is something to say.
     """
-    say_signal = Signal(str)  # Signal to speak text
 
     def __init__(self, rate: int = 160):
         super().__init__()
         self._engine = None
         self._rate = rate  # Speaking speed (words per minute)
         self._running = True
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()  # None = stop
 
     def run(self):
         """Initialize TTS engine and process speak requests"""
@@ -199,18 +630,20 @@ class TTSWorker(QThread):
             print(f"TTS init error: {e}")
             return
 
-        # Connect signal to speak method
-        self.say_signal.connect(self._on_say, Qt.QueuedConnection)
-        
-        # Keep thread alive to process speak requests
+        # Block until text arrives (no polling while idle)
         while self._running:
-            QApplication.processEvents(QEventLoop.ProcessEventsFlags.AllEvents, 10)
-            self.msleep(50)
+            text = self._queue.get()
+            if text is None:
+                break
+            self._speak(text)
         
         self._cleanup()
 
-    @Slot(str)
-    def _on_say(self, text: str):
+    def say(self, text: str):
+        """Queue text to be spoken (safe to call from any thread)"""
+        self._queue.put(text)
+
+    def _speak(self, text: str):
         """Actually speak the text"""
         if not self._engine or not self._running:
             return
@@ -231,6 +664,7 @@ class TTSWorker(QThread):
     def stop(self):
         """Stop the TTS thread"""
         self._running = False
+        self._queue.put(None)  # Wake the thread so it can exit
         try:
             if self._engine:
                 self._engine.stop()
@@ -244,8 +678,10 @@ class ImageProcessingThread(QThread):
     
     Some operations like super resolution can take several seconds.
     Running them in a separate thread keeps the UI responsive.
+    Operations should be built from cv2/NumPy calls (which release the GIL),
+    not Python loops over pixels, or the UI thread will still stall.
     """
-    result_signal = Signal(np.ndarray)   # Emits processed image
+    result_signal = Signal(object)       # Emits the operation's result
     progress_signal = Signal(int)        # Emits progress percentage
     error_signal = Signal(str)           # Emits error message
 
@@ -334,29 +770,55 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1000, 600)
         
         # Image state variables
-        self.current_image: Optional[np.ndarray] = None  # Currently displayed image
+        self._img_version: int = 0  # Bumped on every assignment to current_image
+        self._image: Optional[np.ndarray] = None  # Backing field of current_image
+        self.current_image = None  # Currently displayed image
         self.original_image: Optional[np.ndarray] = None  # Original loaded image (for reset)
+        self._adjust_base: Optional[np.ndarray] = None  # Image before slider adjustments
+        self._planes: Optional[List[np.ndarray]] = None  # H, S, V planes of _adjust_base
+        self._bgr_cache: Optional[np.ndarray] = None  # _adjust_base after saturation/hue
+        self._bgr_cache_key: Optional[Tuple[int, int]] = None  # (saturation, hue) of _bgr_cache
+        self._applied_adjust: Optional[tuple] = None  # (slider values, _img_version) last shown
+        self._hsv_buf: Optional[np.ndarray] = None  # Scratch HSV image reused across recomputes
         self.zoom_level: float = 1.0
         
-        # Undo/Redo stacks (stores compressed images)
-        self.undo_stack: List[bytes] = []
-        self.redo_stack: List[bytes] = []
+        # Use CUDA for heavy filters when OpenCV was built with it and a GPU is present
+        self._gpu: bool = hasattr(cv2, "cuda") and cv2.cuda.getCudaEnabledDeviceCount() > 0
+        
+        # Full-size pixmap of current_image, reused while only the zoom changes
+        self._base_qpixmap: Optional[QPixmap] = None
+        self._pixmap_version: int = -1  # _img_version the pixmap was built from
+        
+        # Wheel zoom scales with the fast transform; re-render smoothly once it stops
+        self._zoom_settle = QTimer(self)
+        self._zoom_settle.setSingleShot(True)
+        self._zoom_settle.setInterval(120)
+        self._zoom_settle.timeout.connect(self.display_image)
+        
+        # Undo/Redo stacks (compressed images, or op names for invertible edits)
+        # Bounded deques drop the oldest state automatically when full
         self.max_stack_size: int = 20  # Limit to prevent excessive memory usage
+        self.undo_stack: Deque[UndoEntry] = deque(maxlen=self.max_stack_size)
+        self.redo_stack: Deque[UndoEntry] = deque(maxlen=self.max_stack_size)
+        self._last_undo_ref: Optional[weakref.ref] = None  # Image on top of undo_stack
         
         # File management
         self.has_unsaved_changes = False
+        self._io_thread: Optional[ImageProcessingThread] = None  # Last file load/save worker
+        self._io_path: str = ""  # File the running load/save is for
+        self._saved_image: Optional[np.ndarray] = None  # Image being written by a save
         self.recent_files: List[str] = []
         self.max_recent_files: int = 10
         
-        # Voice command history
-        self.command_history: List[str] = []
+        # Voice command history (bounded; oldest entry drops off when full)
         self.max_history_size: int = 15
+        self.command_history: Deque[str] = deque(maxlen=self.max_history_size)
         
         # Setup everything
         self._apply_theme()
         self._setup_ui()
         self._setup_threads()
-        self._compile_patterns()
+        self._setup_commands()
         
         # Enable Ctrl+Wheel zoom on image
         self.image_label.installEventFilter(self)
@@ -366,118 +828,31 @@ class MainWindow(QMainWindow):
         if app:
             app.aboutToQuit.connect(self._cleanup)
 
+    @property
+    def current_image(self) -> Optional[np.ndarray]:
+        """Currently displayed image"""
+        return self._image
+
+    @current_image.setter
+    def current_image(self, img: Optional[np.ndarray]):
+        # Edits always assign a new array rather than writing into the old
+        # one, so counting assignments tells caches when the pixels changed.
+        # Kept C-contiguous so display and undo snapshots can use the buffer
+        # directly instead of copying it on every use.
+        if img is not None and not img.flags.c_contiguous:
+            img = np.ascontiguousarray(img)
+        self._image = img
+        self._img_version += 1
+
     def _apply_theme(self):
         """Apply Windows 11 dark theme colors and styles"""
         QApplication.setStyle("Fusion")
         
         # Set color palette
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(Theme.BG_PRIMARY))
-        palette.setColor(QPalette.WindowText, QColor(Theme.TEXT_PRIMARY))
-        palette.setColor(QPalette.Base, QColor(Theme.BG_SECONDARY))
-        palette.setColor(QPalette.AlternateBase, QColor(Theme.BG_TERTIARY))
-        palette.setColor(QPalette.Text, QColor(Theme.TEXT_PRIMARY))
-        palette.setColor(QPalette.Button, QColor(Theme.BG_TERTIARY))
-        palette.setColor(QPalette.ButtonText, QColor(Theme.TEXT_PRIMARY))
-        palette.setColor(QPalette.Highlight, QColor(Theme.ACCENT_BLUE))
-        palette.setColor(QPalette.HighlightedText, QColor(Theme.TEXT_PRIMARY))
-        QApplication.setPalette(palette)
+        QApplication.setPalette(_build_palette())
         
         # Apply global stylesheet for consistent look
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background: {Theme.BG_PRIMARY};
-            }}
-            QPushButton {{
-                background-color: {Theme.ACCENT_BLUE};
-                color: {Theme.TEXT_PRIMARY};
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 11px;
-                min-height: 28px;
-            }}
-            QPushButton:hover {{
-                background-color: #1984D8;
-            }}
-            QPushButton:pressed {{
-                background-color: #005A9E;
-            }}
-            QPushButton:checked {{
-                background-color: {Theme.ACCENT_GREEN};
-            }}
-            QGroupBox {{
-                background: {Theme.BG_SECONDARY};
-                border: 1px solid {Theme.BORDER};
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 12px;
-                font-weight: bold;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }}
-            QSlider::groove:horizontal {{
-                height: 4px;
-                background: {Theme.BG_TERTIARY};
-                border-radius: 2px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {Theme.ACCENT_BLUE};
-                width: 14px;
-                height: 14px;
-                margin: -5px 0;
-                border-radius: 7px;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {Theme.ACCENT_BLUE};
-                border-radius: 2px;
-            }}
-            QProgressBar {{
-                background: {Theme.BG_TERTIARY};
-                border: 1px solid {Theme.BORDER};
-                border-radius: 4px;
-                text-align: center;
-                color: {Theme.TEXT_PRIMARY};
-            }}
-            QProgressBar::chunk {{
-                background: {Theme.ACCENT_BLUE};
-                border-radius: 4px;
-            }}
-            QListWidget {{
-                background: {Theme.BG_SECONDARY};
-                border: 1px solid {Theme.BORDER};
-                border-radius: 4px;
-                padding: 4px;
-            }}
-            QListWidget::item {{
-                padding: 6px;
-                border-radius: 3px;
-            }}
-            QListWidget::item:hover {{
-                background: {Theme.BG_TERTIARY};
-            }}
-            QListWidget::item:selected {{
-                background: {Theme.ACCENT_BLUE};
-            }}
-            QDockWidget::title {{
-                background: {Theme.BG_TERTIARY};
-                padding: 6px;
-                font-weight: bold;
-            }}
-            QToolBar {{
-                background: {Theme.BG_SECONDARY};
-                border-bottom: 1px solid {Theme.BORDER};
-                spacing: 6px;
-                padding: 6px;
-            }}
-            QStatusBar {{
-                background: {Theme.BG_SECONDARY};
-                border-top: 1px solid {Theme.BORDER};
-            }}
-        """)
+        self.setStyleSheet(_STYLESHEET)
 
     def _setup_ui(self):
         """Setup all UI components in order"""
@@ -529,26 +904,55 @@ class MainWindow(QMainWindow):
         self.image_label.setAlignment(Qt.AlignCenter)
         self.image_label.setAcceptDrops(True)  # Enable drag & drop
         self.image_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self._placeholder_pix: Optional[QPixmap] = None
+        self._placeholder_key: Optional[tuple] = None  # (width, height, pixel ratio) it was drawn for
         self._reset_image_label()
         
         self.scroll_area.setWidget(self.image_label)
         layout.addWidget(self.scroll_area)
 
-    def _reset_image_label(self):
-        """Reset image label to show placeholder text"""
-        self.image_label.setText(
+    def _build_placeholder_pixmap(self, width: int, height: int, ratio: float) -> QPixmap:
+        """Render the drop-zone placeholder filling a width x height label
+        
+        Drawn at the screen's device pixel ratio so the border and text stay
+        sharp on scaled displays (125-150% is common on Windows).
+        """
+        pixmap = QPixmap(max(1, round(width * ratio)), max(1, round(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        rect = QRect(0, 0, width, height)  # Painter works in logical pixels
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(Theme.BORDER), 2, Qt.DashLine))
+        painter.setBrush(QColor(Theme.BG_SECONDARY))
+        painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 8, 8)
+        
+        font = QFont("Segoe UI")
+        font.setPixelSize(14)
+        painter.setFont(font)
+        painter.setPen(QColor("#888"))
+        painter.drawText(
+            rect, Qt.AlignCenter,
             "📸 Drop Image Here\n\n"
             "or use Import button / Voice commands\n\n"
             "Press F1 for Help"
         )
-        self.image_label.setStyleSheet(f"""
-            background: {Theme.BG_SECONDARY};
-            border: 2px dashed {Theme.BORDER};
-            border-radius: 8px;
-            color: #888;
-            font-size: 14px;
-            padding: 40px;
-        """)
+        painter.end()
+        return pixmap
+
+    def _reset_image_label(self):
+        """Reset image label to show placeholder
+        
+        The placeholder is only repainted when the label's size or pixel
+        ratio changed; otherwise the last rendering is reused.
+        """
+        size = self.image_label.size()
+        key = (size.width(), size.height(), self.devicePixelRatioF())
+        if self._placeholder_key != key:
+            self._placeholder_pix = self._build_placeholder_pixmap(*key)
+            self._placeholder_key = key
+        self.image_label.setPixmap(self._placeholder_pix)
 
     def _setup_toolbar(self):
         """Setup top toolbar with main action buttons"""
@@ -573,8 +977,20 @@ class MainWindow(QMainWindow):
         save_btn.clicked.connect(self.save_image_dialog)
         toolbar.addWidget(save_btn)
         
-        # Recent files dropdown menu
+        # Recent files dropdown menu. One action per slot is created up front;
+        # _update_recent_menu just relabels and shows/hides them.
         self.recent_menu = QMenu(self)
+        self._no_recent_action = self.recent_menu.addAction("No recent files")
+        self._no_recent_action.setEnabled(False)
+        self._recent_actions = []
+        for i in range(self.max_recent_files):
+            action = self.recent_menu.addAction("")
+            action.triggered.connect(lambda checked, i=i: self._open_recent(i))
+            self._recent_actions.append(action)
+        self._recent_separator = self.recent_menu.addSeparator()
+        self._clear_recent_action = self.recent_menu.addAction("Clear Recent")
+        self._clear_recent_action.triggered.connect(lambda: setattr(self, 'recent_files', []) or self._update_recent_menu())
+        self._update_recent_menu()
         recent_btn = QPushButton("📋 Recent")
         recent_btn.clicked.connect(lambda: self.recent_menu.exec(self.cursor().pos()))
         toolbar.addWidget(recent_btn)
@@ -677,17 +1093,24 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(12)
         
+        # Sliders emit on every step while dragging; coalesce into one
+        # recompute once they've been still for 30 ms
+        self._adjust_timer = QTimer(self)
+        self._adjust_timer.setSingleShot(True)
+        self._adjust_timer.setInterval(30)
+        self._adjust_timer.timeout.connect(self._recompute_adjustments)
+        
         # Brightness slider (-100 to +100)
         bright_group = QGroupBox("💡 Brightness")
         bright_layout = QVBoxLayout(bright_group)
         self.brightness_slider = QSlider(Qt.Horizontal)
         self.brightness_slider.setRange(-100, 100)
         self.brightness_slider.setValue(0)
-        self.brightness_slider.valueChanged.connect(self.apply_brightness)
+        self.brightness_slider.valueChanged.connect(self._schedule_adjust)
         self.brightness_label = QLabel("0")
         self.brightness_label.setAlignment(Qt.AlignCenter)
         # Update label when slider moves
-        self.brightness_slider.valueChanged.connect(lambda v: self.brightness_label.setText(str(v)))
+        self.brightness_slider.valueChanged.connect(self.brightness_label.setNum)
         bright_layout.addWidget(self.brightness_slider)
         bright_layout.addWidget(self.brightness_label)
         layout.addWidget(bright_group)
@@ -698,10 +1121,10 @@ class MainWindow(QMainWindow):
         self.contrast_slider = QSlider(Qt.Horizontal)
         self.contrast_slider.setRange(0, 200)
         self.contrast_slider.setValue(100)
-        self.contrast_slider.valueChanged.connect(self.apply_contrast)
+        self.contrast_slider.valueChanged.connect(self._schedule_adjust)
         self.contrast_label = QLabel("100")
         self.contrast_label.setAlignment(Qt.AlignCenter)
-        self.contrast_slider.valueChanged.connect(lambda v: self.contrast_label.setText(str(v)))
+        self.contrast_slider.valueChanged.connect(self.contrast_label.setNum)
         contrast_layout.addWidget(self.contrast_slider)
         contrast_layout.addWidget(self.contrast_label)
         layout.addWidget(contrast_group)
@@ -712,10 +1135,10 @@ class MainWindow(QMainWindow):
         self.saturation_slider = QSlider(Qt.Horizontal)
         self.saturation_slider.setRange(0, 200)
         self.saturation_slider.setValue(100)
-        self.saturation_slider.valueChanged.connect(self.apply_saturation)
+        self.saturation_slider.valueChanged.connect(self._schedule_adjust)
         self.saturation_label = QLabel("100")
         self.saturation_label.setAlignment(Qt.AlignCenter)
-        self.saturation_slider.valueChanged.connect(lambda v: self.saturation_label.setText(str(v)))
+        self.saturation_slider.valueChanged.connect(self.saturation_label.setNum)
         saturation_layout.addWidget(self.saturation_slider)
         saturation_layout.addWidget(self.saturation_label)
         layout.addWidget(saturation_group)
@@ -726,14 +1149,22 @@ class MainWindow(QMainWindow):
         self.hue_slider = QSlider(Qt.Horizontal)
         self.hue_slider.setRange(-180, 180)
         self.hue_slider.setValue(0)
-        self.hue_slider.valueChanged.connect(self.apply_hue)
+        self.hue_slider.valueChanged.connect(self._schedule_adjust)
         self.hue_label = QLabel("0")
         self.hue_label.setAlignment(Qt.AlignCenter)
-        self.hue_slider.valueChanged.connect(lambda v: self.hue_label.setText(str(v)))
+        self.hue_slider.valueChanged.connect(self.hue_label.setNum)
         hue_layout.addWidget(self.hue_slider)
         hue_layout.addWidget(self.hue_label)
         layout.addWidget(hue_group)
         
+        # Named groups of _RE_PARAM -> slider they drive
+        self._param_sliders = {
+            "brightness": self.brightness_slider,
+            "contrast": self.contrast_slider,
+            "saturation": self.saturation_slider,
+            "hue": self.hue_slider,
+        }
+        
         # Reset all adjustments button
         reset_btn = QPushButton("Reset All")
         reset_btn.clicked.connect(self.reset_adjustments)
@@ -797,18 +1228,6 @@ class MainWindow(QMainWindow):
         self.tts_thread = TTSWorker(rate=165)
         self.tts_thread.start()
 
-    def _compile_patterns(self):
-        """Compile regex patterns for parsing voice commands with parameters
-        
-        These patterns extract numbers from commands like:
-        "brightness by 50" -> extracts 50
-        "contrast 120" -> extracts 120
-        """
-        self.re_brightness = re.compile(r"(?:brightness|brighten)\s*(?:by)?\s*(-?\d+)")
-        self.re_contrast = re.compile(r"(?:contrast)\s*(?:by)?\s*(-?\d+)")
-        self.re_saturation = re.compile(r"(?:saturation|saturate)\s*(?:by)?\s*(-?\d+)")
-        self.re_hue = re.compile(r"(?:hue)\s*(?:by)?\s*(-?\d+)")
-
     # ========== Speech Methods ==========
 
     def toggle_voice(self, checked: bool):
@@ -827,7 +1246,7 @@ class MainWindow(QMainWindow):
     def speak(self, text: str):
         """Speak text and show in status bar"""
         self.status(text)
-        self.tts_thread.say_signal.emit(text)
+        self.tts_thread.say(text)
 
     def on_speech_error(self, error: str):
         """Handle speech recognition errors"""
@@ -849,41 +1268,72 @@ class MainWindow(QMainWindow):
         if filename:
             self._load_image_from_path(filename)
 
+    def _start_io(self, operation, *args) -> Optional[ImageProcessingThread]:
+        """Prepare a worker thread for a file load/save (caller starts it)
+        
+        Decoding or encoding a large PNG/TIFF can take seconds, so it runs
+        off the UI thread. Only one file operation runs at a time; returns
+        None if another one is still busy.
+        """
+        if self._io_thread is not None and self._io_thread.isRunning():
+            self.status("⏳ Busy with another file, please wait")
+            return None
+        
+        # Show progress bar
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        
+        thread = ImageProcessingThread(operation, *args)
+        thread.progress_signal.connect(self.progress_bar.setValue)
+        thread.error_signal.connect(self._on_io_error)
+        thread.finished.connect(self._on_io_finished)
+        self._io_thread = thread  # Keep a reference until the next operation
+        return thread
+
+    def _on_io_error(self, message: str):
+        """Report an exception raised by a file load/save"""
+        self.status(f"❌ Error: {message[:50]}")
+
+    def _on_io_finished(self):
+        """Hide the progress bar once the file worker is done"""
+        self.progress_bar.setVisible(False)
+        self._saved_image = None  # Also released when the save raised
+
     def _load_image_from_path(self, path: str):
-        """Load image from file path with progress indicator"""
+        """Load image from file path in the background with progress indicator"""
         if not os.path.exists(path):
             self.status("❌ File not found")
             return
         
-        # Show progress bar
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
+        # Load image using OpenCV (capped at 2048px to prevent memory issues)
+        thread = self._start_io(read_image, path, 2048)
+        if thread is None:
+            return
+        self._io_path = path
+        thread.result_signal.connect(self._on_image_loaded)
+        thread.start()
+
+    def _on_image_loaded(self, img: Optional[np.ndarray]):
+        """Show a freshly decoded image and reset editing state"""
+        if img is None:
+            self.status("❌ Failed to load image")
+            return
         
+        path = self._io_path
         try:
-            # Load image using OpenCV
-            img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
-            if img is None:
-                self.status("❌ Failed to load image")
-                return
-            
-            self.progress_bar.setValue(50)
-            
-            # Resize if image is too large (prevents memory issues)
-            max_size = 2048
-            h, w = img.shape[:2]
-            if max(h, w) > max_size:
-                scale = max_size / max(h, w)
-                new_w, new_h = int(w * scale), int(h * scale)
-                img = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_AREA)
-            
-            # Store original for reset functionality
+            # Store original for reset functionality. Sharing the array is
+            # safe: edits replace current_image, they never write into it.
             self.current_image = img
-            self.original_image = img.copy()
+            self.original_image = img
+            self._adjust_timer.stop()
+            self._clear_adjust_base()
+            self._reset_slider_values()
             self.zoom_level = 1.0
             
             # Clear history stacks for new image
             self.undo_stack.clear()
             self.redo_stack.clear()
+            self._last_undo_ref = None
             self.has_unsaved_changes = False
             
             # Add to recent files list
@@ -892,7 +1342,6 @@ class MainWindow(QMainWindow):
                 self.recent_files = self.recent_files[:self.max_recent_files]
                 self._update_recent_menu()
             
-            self.progress_bar.setValue(100)
             self.display_image()
             
             filename = os.path.basename(path)
@@ -901,8 +1350,6 @@ class MainWindow(QMainWindow):
             
         except Exception as e:
             self.status(f"❌ Error: {str(e)[:50]}")
-        finally:
-            self.progress_bar.setVisible(False)
 
     def save_image_dialog(self):
         """Show save dialog and save current image"""
@@ -916,36 +1363,47 @@ class MainWindow(QMainWindow):
         )
         
         if filename:
-            try:
-                success = cv2.imwrite(filename, self.current_image)
-                if success:
-                    self.has_unsaved_changes = False
-                    self.speak("Image saved")
-                    self.status(f"✓ Saved: {os.path.basename(filename)}")
-                else:
-                    self.status("❌ Save failed")
-            except Exception as e:
-                self.status(f"❌ Error: {str(e)[:50]}")
+            self._flush_adjustments()
+            # Encode in the background; the array is never written to, so
+            # editing can carry on while it is being saved
+            thread = self._start_io(cv2.imwrite, filename, self.current_image)
+            if thread is None:
+                return
+            self._io_path = filename
+            self._saved_image = self.current_image
+            thread.result_signal.connect(self._on_image_saved)
+            thread.start()
+
+    def _on_image_saved(self, success: bool):
+        """Report the result of a background save"""
+        if success:
+            # Edits made while the file was being written are still unsaved
+            if self.current_image is self._saved_image:
+                self.has_unsaved_changes = False
+            self.speak("Image saved")
+            self.status(f"✓ Saved: {os.path.basename(self._io_path)}")
+        else:
+            self.status("❌ Save failed")
+        self._saved_image = None
 
     def _update_recent_menu(self):
         """Update the recent files dropdown menu"""
-        self.recent_menu.clear()
-        
-        if not self.recent_files:
-            action = self.recent_menu.addAction("No recent files")
-            action.setEnabled(False)
-            return
-        
-        # Add each recent file
-        for path in self.recent_files:
-            filename = os.path.basename(path)
-            action = self.recent_menu.addAction(f"📄 {filename}")
-            action.triggered.connect(lambda checked, p=path: self._load_image_from_path(p))
-        
-        # Add clear option
-        self.recent_menu.addSeparator()
-        clear_action = self.recent_menu.addAction("Clear Recent")
-        clear_action.triggered.connect(lambda: setattr(self, 'recent_files', []) or self._update_recent_menu())
+        for i, action in enumerate(self._recent_actions):
+            if i < len(self.recent_files):
+                action.setText(f"📄 {os.path.basename(self.recent_files[i])}")
+                action.setVisible(True)
+            else:
+                action.setVisible(False)
+        
+        has_files = bool(self.recent_files)
+        self._no_recent_action.setVisible(not has_files)
+        self._recent_separator.setVisible(has_files)
+        self._clear_recent_action.setVisible(has_files)
+
+    def _open_recent(self, index: int):
+        """Load the recent file shown in menu slot index"""
+        if index < len(self.recent_files):
+            self._load_image_from_path(self.recent_files[index])
 
     # ========== Drag & Drop ==========
 
@@ -960,22 +1418,33 @@ class MainWindow(QMainWindow):
             if url.isLocalFile():
                 path = url.toLocalFile()
                 # Check if file is an image
-                if path.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.webp', '.tiff', '.gif')):
+                if os.path.splitext(path)[1].lower() in _IMG_EXTS:
                     self._load_image_from_path(path)
                     return
 
     # ========== Undo/Redo ==========
 
-    def save_image_state(self):
-        """Save current image state to undo stack before making changes"""
+    def save_image_state(self, op: Optional[str] = None):
+        """Save current image state to undo stack before making changes
+        
+        op names the upcoming edit when it is in _INVERTIBLE_OPS; only the
+        name is stored then, and undo applies the inverse transform.
+        """
+        self._commit_adjustments()
         if self.current_image is not None:
-            # Compress and store current state
-            compressed = compress_image(self.current_image)
-            self.undo_stack.append(compressed)
+            # Same array as the last saved state (the edit since then was a
+            # no-op, e.g. grayscale on a gray image) - don't store it twice
+            if self._last_undo_ref is not None and self._last_undo_ref() is self.current_image:
+                return
             
-            # Limit stack size to prevent memory issues
-            if len(self.undo_stack) > self.max_stack_size:
-                self.undo_stack.pop(0)
+            if op is not None:
+                self.undo_stack.append(op)
+                self._last_undo_ref = None
+            else:
+                # Compress and store current state
+                compressed = compress_image(self.current_image)
+                self.undo_stack.append(compressed)  # Oldest state falls off when full
+                self._last_undo_ref = weakref.ref(self.current_image)
             
             # Clear redo stack when new action is performed
             self.redo_stack.clear()
@@ -983,27 +1452,41 @@ class MainWindow(QMainWindow):
 
     def undo(self):
         """Undo last operation"""
+        self._commit_adjustments()  # May push the slider change as the step to undo
         if not self.undo_stack:
             self.status("Nothing to undo")
             return
         
-        # Save current state to redo stack
-        self.redo_stack.append(compress_image(self.current_image))
-        # Restore previous state
-        self.current_image = decompress_image(self.undo_stack.pop())
+        self._last_undo_ref = None
+        entry = self.undo_stack.pop()
+        if isinstance(entry, str):
+            # Invertible edit: step back with its inverse transform
+            self.redo_stack.append(entry)
+            self.current_image = _INVERTIBLE_OPS[entry][1](self.current_image)
+        else:
+            # Save current state to redo stack, then restore previous state
+            self.redo_stack.append(compress_image(self.current_image))
+            self.current_image = decompress_image(entry)
         self.display_image()
         self.speak("Undo applied")
 
     def redo(self):
         """Redo last undone operation"""
+        self._commit_adjustments()  # A pending slider change discards the redo history
         if not self.redo_stack:
             self.status("Nothing to redo")
             return
         
-        # Save current state to undo stack
-        self.undo_stack.append(compress_image(self.current_image))
-        # Restore next state
-        self.current_image = decompress_image(self.redo_stack.pop())
+        self._last_undo_ref = None
+        entry = self.redo_stack.pop()
+        if isinstance(entry, str):
+            # Invertible edit: apply it again
+            self.undo_stack.append(entry)
+            self.current_image = _INVERTIBLE_OPS[entry][0](self.current_image)
+        else:
+            # Save current state to undo stack, then restore next state
+            self.undo_stack.append(compress_image(self.current_image))
+            self.current_image = decompress_image(entry)
         self.display_image()
         self.speak("Redo applied")
 
@@ -1026,7 +1509,10 @@ class MainWindow(QMainWindow):
         self.save_image_state()
         
         # 15x15 kernel size for moderate blur
-        self.current_image = cv2.GaussianBlur(self.current_image, (15, 15), 0)
+        if self._gpu and self.current_image.dtype == np.uint8:
+            self.current_image = gaussian_blur_cuda(self.current_image, (15, 15))
+        else:
+            self.current_image = cv2.GaussianBlur(self.current_image, (15, 15), 0)
         self.display_image()
         self.speak("Blur applied")
 
@@ -1035,11 +1521,7 @@ class MainWindow(QMainWindow):
         if not self._check_image(): return
         self.save_image_state()
         
-        # Sharpening kernel (enhances edges)
-        kernel = np.array([[-1, -1, -1],
-                          [-1,  9, -1],
-                          [-1, -1, -1]])
-        self.current_image = cv2.filter2D(self.current_image, -1, kernel)
+        self.current_image = cv2.filter2D(self.current_image, -1, _SHARPEN_KERNEL)
         self.display_image()
         self.speak("Sharpen applied")
 
@@ -1064,19 +1546,16 @@ class MainWindow(QMainWindow):
         if img.ndim == 2:
             img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
         
-        # Sepia transformation matrix
-        kernel = np.array([[0.272, 0.534, 0.131],
-                          [0.349, 0.686, 0.168],
-                          [0.393, 0.769, 0.189]])
-        self.current_image = cv2.transform(img, kernel)
-        self.current_image = np.clip(self.current_image, 0, 255).astype(np.uint8)
+        # One SIMD pass over the pixels with the precomputed sepia matrix;
+        # the output keeps the uint8 input type, so values saturate at 255
+        self.current_image = cv2.transform(img, _SEPIA_KERNEL)
         self.display_image()
         self.speak("Sepia applied")
 
     def apply_invert(self):
         """Invert all colors (negative effect)"""
         if not self._check_image(): return
-        self.save_image_state()
+        self.save_image_state("invert")
         
         self.current_image = cv2.bitwise_not(self.current_image)
         self.display_image()
@@ -1117,83 +1596,149 @@ class MainWindow(QMainWindow):
     # ========== Adjustments ==========
     # These adjust existing image properties using sliders
 
-    def apply_brightness(self, value: int):
-        """Adjust brightness by adding/subtracting value from pixels"""
-        if not self._check_image(): return
-        
-        # Store original image on first adjustment
-        if not hasattr(self, '_brightness_base'):
-            self._brightness_base = self.current_image.copy()
-        
-        v = clamp(int(value), -100, 100)
-        # Add brightness value to each pixel (beta parameter)
-        self.current_image = cv2.convertScaleAbs(self._brightness_base, alpha=1, beta=v)
-        self.display_image()
+    def _schedule_adjust(self):
+        """Queue a slider recompute (restarts the coalescing timer)"""
+        self._adjust_timer.start()
 
-    def apply_contrast(self, value: int):
-        """Adjust contrast by scaling pixel values"""
-        if not self._check_image(): return
-        
-        # Store original image on first adjustment
-        if not hasattr(self, '_contrast_base'):
-            self._contrast_base = self.current_image.copy()
-        
-        v = clamp(int(value), 0, 200)
-        # Scale pixels by contrast factor (alpha parameter)
-        self.current_image = cv2.convertScaleAbs(self._contrast_base, alpha=v / 100.0, beta=0)
-        self.display_image()
+    def _flush_adjustments(self):
+        """Apply a still-pending slider recompute before other edits"""
+        if self._adjust_timer.isActive():
+            self._adjust_timer.stop()
+            self._recompute_adjustments()
 
-    def apply_saturation(self, value: int):
-        """Adjust color saturation in HSV color space"""
-        if not self._check_image(): return
-        
-        v = clamp(int(value), 0, 200)
-        img = self.current_image
-        if img.ndim == 2:
-            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+    def _commit_adjustments(self):
+        """Make the adjusted image the base for any later slider moves
         
-        # Convert to HSV and adjust S (saturation) channel
-        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV).astype(np.float32)
-        hsv[:, :, 1] = np.clip(hsv[:, :, 1] * (v / 100.0), 0, 255)
-        hsv = hsv.astype(np.uint8)
-        self.current_image = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
-        self.display_image()
+        Called before every other edit, undo and redo, so sliders never
+        recompute from an image that edit has since replaced. A slider
+        change is recorded as its own undo step here, so entries below it
+        (including op-name entries, which replay onto current_image) still
+        see exactly the image they produced.
+        """
+        self._flush_adjustments()
+        base = self._adjust_base
+        if base is not None and self.current_image is not base:
+            self.undo_stack.append(compress_image(base))
+            self._last_undo_ref = weakref.ref(base)
+            self.redo_stack.clear()
+            self.has_unsaved_changes = True
+        self._clear_adjust_base()
+        self._reset_slider_values()
+
+    def _reset_slider_values(self):
+        """Put the sliders back to their defaults without triggering a recompute"""
+        for slider, label, value in ((self.brightness_slider, self.brightness_label, 0),
+                                     (self.contrast_slider, self.contrast_label, 100),
+                                     (self.saturation_slider, self.saturation_label, 100),
+                                     (self.hue_slider, self.hue_label, 0)):
+            slider.blockSignals(True)
+            slider.setValue(value)
+            slider.blockSignals(False)
+            label.setNum(value)
+
+    def _clear_adjust_base(self):
+        """Forget the pre-adjustment image and everything derived from it"""
+        self._adjust_base = None
+        self._planes = None
+        self._bgr_cache = None
+        self._bgr_cache_key = None
+        self._applied_adjust = None
+
+    def _ensure_planes(self) -> List[np.ndarray]:
+        """Split the adjustment base into separate H, S, V planes (once per base)
+        
+        Keeping planes separate lets saturation/hue touch only the plane
+        they change, and skips the BGR->HSV conversion on every slider move.
+        """
+        if self._planes is None:
+            img = self._adjust_base
+            if img.ndim == 2:
+                img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+            elif img.shape[2] == 4:
+                img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+            hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV, dst=self._get_hsv_buf(img.shape[:2]))
+            self._planes = list(cv2.split(hsv))
+        return self._planes
+
+    def _get_hsv_buf(self, size: Tuple[int, int]) -> np.ndarray:
+        """Return the scratch HSV buffer for an image of (height, width)
+        
+        Only ever used as an intermediate (split into planes, or merged and
+        converted back to BGR), so one buffer can serve every recompute; it
+        is reallocated only when the image size changes.
+        """
+        if self._hsv_buf is None or self._hsv_buf.shape[:2] != size:
+            self._hsv_buf = np.empty((*size, 3), np.uint8)
+        return self._hsv_buf
 
-    def apply_hue(self, value: int):
-        """Shift hue (color) in HSV color space"""
+    def _recompute_adjustments(self):
+        """Apply all four slider values to the pre-adjustment image
+        
+        Always starts from the same base image so adjustments don't compound.
+        Saturation and hue share one HSV round-trip with lookup tables on the
+        S and H planes; brightness and contrast are fused into one 256-entry
+        lookup table, so each stage is a single uint8 pass over the pixels.
+        """
         if not self._check_image(): return
         
-        v = clamp(int(value), -180, 180)
-        img = self.current_image
-        if img.ndim == 2:
-            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+        # Store original image on first adjustment
+        if self._adjust_base is None:
+            self._adjust_base = self.current_image
+        img = self._adjust_base
+        
+        brightness = clamp(self.brightness_slider.value(), -100, 100)
+        contrast = clamp(self.contrast_slider.value(), 0, 200)
+        saturation = clamp(self.saturation_slider.value(), 0, 200)
+        hue = clamp(self.hue_slider.value(), -180, 180)
+        
+        # A drag that ends where it started (or only passed through values
+        # the timer coalesced away) leaves the image as it already is
+        values = (brightness, contrast, saturation, hue)
+        if self._applied_adjust == (values, self._img_version):
+            return
         
-        # Convert to HSV and shift H (hue) channel
-        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV).astype(np.int16)
-        hsv[:, :, 0] = (hsv[:, :, 0] + v) % 180  # Hue is circular (0-180)
-        hsv = hsv.astype(np.uint8)
-        self.current_image = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
+        # Saturation & hue in HSV color space (skipped at default values).
+        # The result is cached, so dragging brightness/contrast reuses it.
+        if saturation != 100 or hue != 0:
+            if self._bgr_cache_key != (saturation, hue):
+                h, s, v = self._ensure_planes()
+                if hue != 0:
+                    h = cv2.LUT(h, hue_shift_lut(hue))  # Hue is circular (0-180)
+                if saturation != 100:
+                    s = cv2.LUT(s, saturation_lut(saturation))
+                hsv = cv2.merge((h, s, v), dst=self._get_hsv_buf(v.shape))
+                self._bgr_cache = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)  # New array (becomes current_image)
+                self._bgr_cache_key = (saturation, hue)
+            img = self._bgr_cache
+        
+        # Brightness & contrast: pixel * contrast + brightness (skipped at default values)
+        if brightness != 0 or contrast != 100:
+            img = cv2.LUT(img, brightness_contrast_lut(brightness, contrast))
+        
+        self.current_image = img
+        self._applied_adjust = (values, self._img_version)
         self.display_image()
 
     def reset_adjustments(self):
         """Reset all sliders to default values"""
-        self.brightness_slider.setValue(0)
-        self.contrast_slider.setValue(100)
-        self.saturation_slider.setValue(100)
-        self.hue_slider.setValue(0)
-        
-        # Clear cached base images
-        if hasattr(self, '_brightness_base'):
-            delattr(self, '_brightness_base')
-        if hasattr(self, '_contrast_base'):
-            delattr(self, '_contrast_base')
+        self._adjust_timer.stop()
+        self._reset_slider_values()
+        
+        # Show the unadjusted image right away and clear cached base image,
+        # but only while current_image is still the sliders' own output
+        # (going back to the base would otherwise drop later edits)
+        applied = self._applied_adjust
+        if self._adjust_base is not None and applied is not None and applied[1] == self._img_version:
+            self.current_image = self._adjust_base
+            self.display_image()
+        self._clear_adjust_base()
 
     # ========== Transforms ==========
 
     def rotate_left(self):
         """Rotate image 90 degrees counter-clockwise"""
         if not self._check_image(): return
-        self.save_image_state()
+        self.save_image_state("rotate_left")
         
         self.current_image = cv2.rotate(self.current_image, cv2.ROTATE_90_COUNTERCLOCKWISE)
         self.display_image()
@@ -1202,7 +1747,7 @@ class MainWindow(QMainWindow):
     def rotate_right(self):
         """Rotate image 90 degrees clockwise"""
         if not self._check_image(): return
-        self.save_image_state()
+        self.save_image_state("rotate_right")
         
         self.current_image = cv2.rotate(self.current_image, cv2.ROTATE_90_CLOCKWISE)
         self.display_image()
@@ -1211,7 +1756,7 @@ class MainWindow(QMainWindow):
     def flip_horizontal(self):
         """Flip image horizontally (mirror)"""
         if not self._check_image(): return
-        self.save_image_state()
+        self.save_image_state("flip_horizontal")
         
         self.current_image = cv2.flip(self.current_image, 1)
         self.display_image()
@@ -1220,7 +1765,7 @@ class MainWindow(QMainWindow):
     def flip_vertical(self):
         """Flip image vertically (upside down)"""
         if not self._check_image(): return
-        self.save_image_state()
+        self.save_image_state("flip_vertical")
         
         self.current_image = cv2.flip(self.current_image, 0)
         self.display_image()
@@ -1228,41 +1773,59 @@ class MainWindow(QMainWindow):
 
     # ========== Display & Zoom ==========
 
-    def display_image(self):
-        """Convert current image to QPixmap and display with zoom level"""
+    def display_image(self, transformation: Qt.TransformationMode = Qt.SmoothTransformation):
+        """Convert current image to QPixmap and display with zoom level
+        
+        Pass Qt.FastTransformation for interactive updates (e.g. wheel zoom)
+        where smooth scaling of a large image would lag.
+        """
         if self.current_image is None:
             self._reset_image_label()
             return
         
-        # Convert NumPy array to Qt format
-        qimg = numpy_to_qimage(self.current_image)
-        pixmap = QPixmap.fromImage(qimg)
-        
-        # Apply zoom scaling
-        scaled = pixmap.scaled(pixmap.size() * self.zoom_level, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # Apply zoom scaling. Heavy zoom-outs are shrunk as pixels (much better
+        # filtering for big ratios) and never need the full-size pixmap;
+        # everything else scales the cached pixmap.
+        if transformation == Qt.SmoothTransformation and self.zoom_level < 0.25:
+            h, w = self.current_image.shape[:2]
+            new_w, new_h = max(1, round(w * self.zoom_level)), max(1, round(h * self.zoom_level))
+            small = fast_resize(self.current_image, new_w, new_h)
+            qimg, backing = numpy_to_qimage(small)
+            scaled = QPixmap.fromImage(qimg)  # Copies the pixels out of backing
+        else:
+            # Convert NumPy array to Qt format only when the pixels changed
+            # (zoom-only updates reuse the pixmap)
+            if self._pixmap_version != self._img_version:
+                qimg, backing = numpy_to_qimage(self.current_image)
+                self._base_qpixmap = QPixmap.fromImage(qimg)  # Copies the pixels out of backing
+                self._pixmap_version = self._img_version
+            pixmap = self._base_qpixmap
+            scaled = pixmap.scaled(pixmap.size() * self.zoom_level, Qt.KeepAspectRatio, transformation)
         
         self.image_label.setPixmap(scaled)
         self.image_label.resize(scaled.size())
-        self.image_label.setStyleSheet("")  # Remove placeholder styling
         
         # Update status bar with image info
         h, w = self.current_image.shape[:2]
         unsaved = "*" if self.has_unsaved_changes else ""
         self.status(f"Image: {w}×{h}{unsaved} | Zoom: {int(self.zoom_level * 100)}%")
 
+    def _zoom_by(self, factor: float, transformation: Qt.TransformationMode = Qt.SmoothTransformation):
+        """Scale zoom level by factor, kept between 0.1x and 10x"""
+        self.zoom_level = clamp(self.zoom_level * factor, 0.1, 10.0)
+        self.display_image(transformation)
+
     def zoom_in(self):
         """Increase zoom level (max 10x)"""
         if not self._check_image(): return
         
-        self.zoom_level = min(self.zoom_level * 1.25, 10.0)
-        self.display_image()
+        self._zoom_by(1.25)
 
     def zoom_out(self):
         """Decrease zoom level (min 0.1x)"""
         if not self._check_image(): return
         
-        self.zoom_level = max(self.zoom_level / 1.25, 0.1)
-        self.display_image()
+        self._zoom_by(1 / 1.25)
 
     def reset_zoom(self):
         """Reset zoom to 100% (actual size)"""
@@ -1293,35 +1856,16 @@ class MainWindow(QMainWindow):
             return
         
         self.save_image_state()  # Allow undoing the reset
-        self.current_image = self.original_image.copy()
+        self.current_image = self.original_image
         self.display_image()
         self.speak("Image reset")
 
     # ========== Voice Commands ==========
 
-    def handle_command(self, command: str):
-        """Process recognized voice command
-        
-        Uses fuzzy matching to handle similar-sounding commands.
-        First checks for parameterized commands (with numbers),
-        then checks simple commands using fuzzy matching.
-        """
-        cmd = command.strip().lower()
-        
-        # Add to command history
-        self.command_history.append(command)
-        if len(self.command_history) > self.max_history_size:
-            self.command_history.pop(0)
-        
-        # Update history display (most recent first)
-        self.history_list.clear()
-        for c in reversed(self.command_history):
-            self.history_list.addItem(f"🎤 {c}")
-        
-        self.status(f"🎤 {command}")
-        
-        # Map of command keywords to functions
-        commands = {
+    def _setup_commands(self):
+        """Build the voice command dispatch table"""
+        # Map of command keywords to functions, built once rather than per utterance
+        self._commands = {
             "grayscale": self.apply_grayscale,
             "blur": self.apply_blur,
             "sharpen": self.apply_sharpen,
@@ -1345,36 +1889,50 @@ class MainWindow(QMainWindow):
             "help": self.show_help,
             "exit": self.close,
         }
+        self._command_keys = tuple(self._commands)
+
+    def handle_command(self, command: str):
+        """Process recognized voice command
         
-        # Try fuzzy matching for simple commands
-        # Allows "grey scale" to match "grayscale", etc.
-        best_match = None
-        best_score = 0
-        for key in commands.keys():
-            score = fuzz.ratio(cmd, key)
-            if score > 75 and score > best_score:  # 75% similarity threshold
-                best_score = score
-                best_match = key
+        Tries, in order: an exact command keyword, the accepted phrase
+        variants (_RE_COMMAND), fuzzy matching for similar-sounding
+        commands, and finally parameterized commands with numbers
+        (_RE_PARAM, e.g. "brightness by 50").
+        """
+        cmd = command.strip().lower()
         
-        if best_match:
-            commands[best_match]()
-            return
+        # Add to command history
+        self.command_history.append(command)
         
-        # Check for parameterized commands (e.g., "brightness by 50")
-        if m := self.re_brightness.search(cmd):
-            self.brightness_slider.setValue(int(m.group(1)))
+        # Update history display (most recent first), dropping the oldest row
+        self.history_list.insertItem(0, f"🎤 {command}")
+        if self.history_list.count() > self.max_history_size:
+            self.history_list.takeItem(self.history_list.count() - 1)
+        
+        self.status(f"🎤 {command}")
+        
+        commands = self._commands
+        
+        # Exact command keyword: plain dict lookup
+        if cmd in commands:
+            commands[cmd]()
             return
         
-        if m := self.re_contrast.search(cmd):
-            self.contrast_slider.setValue(int(m.group(1)))
+        # Exact phrases (including variants like "grey scale") in one pass
+        if m := _RE_COMMAND.fullmatch(cmd):
+            commands[_COMMAND_IDS[int(m.lastgroup[1:])]]()
             return
         
-        if m := self.re_saturation.search(cmd):
-            self.saturation_slider.setValue(int(m.group(1)))
+        # Fall back to fuzzy matching for near misses (75% similarity threshold).
+        # Scores every key in one C++ call, stopping early on a perfect match.
+        best_match = process.extractOne(cmd, self._command_keys, scorer=fuzz.ratio, score_cutoff=75)
+        if best_match:
+            commands[best_match[0]]()
             return
         
-        if m := self.re_hue.search(cmd):
-            self.hue_slider.setValue(int(m.group(1)))
+        # Check for parameterized commands (e.g., "brightness by 50")
+        if m := _RE_PARAM.search(cmd):
+            self._param_sliders[m.lastgroup].setValue(int(m.group(m.lastgroup)))
             return
         
         # Command not recognized
@@ -1401,15 +1959,18 @@ class MainWindow(QMainWindow):
     # ========== Events ==========
 
     def eventFilter(self, obj, event):
-        """Event filter for Ctrl+Wheel zoom on image"""
+        """Event filter for Ctrl+Wheel zoom on image (and placeholder resizing)"""
+        if obj is self.image_label and event.type() == QEvent.Resize and self.current_image is None:
+            # Keep the placeholder filling the label as the window resizes
+            self._reset_image_label()
         if obj is self.image_label and isinstance(event, QWheelEvent):
             if QApplication.keyboardModifiers() & Qt.ControlModifier:
                 if self.current_image is not None:
-                    # Wheel up = zoom in, wheel down = zoom out
-                    if event.angleDelta().y() > 0:
-                        self.zoom_in()
-                    else:
-                        self.zoom_out()
+                    # Wheel up = zoom in, wheel down = zoom out.
+                    # Scale cheaply while the wheel turns, smoothly once it settles.
+                    factor = 1.25 if event.angleDelta().y() > 0 else 1 / 1.25
+                    self._zoom_by(factor, Qt.FastTransformation)
+                    self._zoom_settle.start()
                     return True
         return super().eventFilter(obj, event)
 
@@ -1434,8 +1995,11 @@ class MainWindow(QMainWindow):
         """Stop all background threads gracefully"""
         try:
             if hasattr(self, "speech_thread"):
-                self.speech_thread.stop_listening()
+                self.speech_thread.shutdown()
                 self.speech_thread.wait(2000)
+                # Still inside listen(): the thread closes the stream itself on its way out
+                if not self.speech_thread.isRunning():
+                    self.speech_thread.close_microphone()
         except: 
             pass
         
@@ -1445,6 +2009,10 @@ class MainWindow(QMainWindow):
                 self.tts_thread.wait(2000)
         except: 
             pass
+        
+        # Let a running save finish writing its file
+        if self._io_thread is not None:
+            self._io_thread.wait()
 
 
 # ========== Main Entry Point ==========